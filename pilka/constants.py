@@ -22,8 +22,13 @@ Method = Callable[[Any, tuple[Any, ...]], Any]  # method with signature def meth
 Function = Callable[[tuple[Any, ...]], Any]  # function with signature def funcname(*args)
 
 REQUEST_TIMEOUT = 15  # seconds
+SCRAPING_WORKERS = 4  # number of concurrent per-stadium scrapers
+CONNECTION_POOL_SIZE = 32  # max number of kept-alive connections per host
+HTTP_CACHE_EXPIRY = 7 * 24 * 60 * 60  # seconds (a week)
+RATE_LIMIT_MAX_WAIT = 300  # seconds (caps waits requested by rate-limited hosts)
 FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 READABLE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 SECONDS_IN_YEAR = 365.25 * 24 * 60 * 60  # with leap years
 
 OUTPUT_DIR = Path(os.getcwd()) / "var" / "output"
+HTTP_CACHE_DIR = Path(os.getcwd()) / "var" / "http_cache"
@@ -7,47 +7,63 @@
     @author: z33k
 
 """
-import json
 import logging
 import random
 import re
-import traceback
+import threading
 from collections import defaultdict
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, fields
 from datetime import date, datetime
+from functools import cache, lru_cache
 from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Any, Callable, Iterable, Iterator, TypeVar
+from urllib.parse import urlsplit
 
-from bs4 import BeautifulSoup, Tag
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from requests.exceptions import HTTPError
 
 from pilka.constants import FILENAME_TIMESTAMP_FORMAT, OUTPUT_DIR, \
-    PathLike, READABLE_TIMESTAMP_FORMAT
+    PathLike, READABLE_TIMESTAMP_FORMAT, SCRAPING_WORKERS
 from pilka.constants import T
 from pilka.stadiums.data import BasicStadium, Cost, Country, CountryStadiumsData, Duration, League, \
     Nickname, POLAND, Stadium, SubCapacity, Town
 from pilka.utils import ParsingError, clean_parenthesized, extract_date, extract_float, extract_int, \
     from_iterable, getdir, timed
-from pilka.utils.scrape import ScrapingError, getsoup, http_requests_counted, throttled
+from pilka.utils.scrape import ScrapingError, getsoup, http_requests_counted, is_cached, \
+    throttled
 
 _log = logging.getLogger(__name__)
 
 
+_NORMALIZATION_TABLE = str.maketrans({"–": "-", "−": "-", "’": "'"})
+
+
 def normalize(text: str) -> str:
-    return text.replace("–", "-").replace("−", "-").replace("’", "'")
+    return text.translate(_NORMALIZATION_TABLE)
+
 
+@cache
+def scrape_polish_towns() -> tuple[Town, ...]:
+    """Scrape Polish towns statistics from Wikipedia.
 
-def scrape_polish_towns() -> list[Town]:
+    The result is cached so the page is requested at most once per process.
+    """
     url = "https://pl.wikipedia.org/wiki/Dane_statystyczne_o_miastach_w_Polsce"
-    soup = getsoup(url)
+    soup = getsoup(url, parse_only=SoupStrainer("table"))
     table = soup.find("table", class_="wikitable")
     if table is None:
         raise ScrapingError(f"Page at {url} contains no 'table' tag of class 'wikitable'")
     towns = []
-    for tr_tag in table.select("tbody tr"):
+    tbody = table.find("tbody")
+    for tr_tag in tbody.find_all("tr", recursive=False) if tbody else []:
+        cells = tr_tag.find_all("td", limit=5)  # only the leading columns are of interest
+        if len(cells) < 5:
+            continue
+        name, county, voivod, area, pop = [tag.text.strip() for tag in cells]
         try:
-            name, county, voivod, area, pop, *_ = [
-                tag.text.strip() for tag in tr_tag.find_all("td")]
             towns.append(Town(name, county.replace("[a]", ""), voivod, int(pop), int(area)))
         except ValueError:
             pass
@@ -57,7 +73,12 @@ def scrape_polish_towns() -> list[Town]:
             area_ha=490),
         Town(name="Stężyca", county="kartuski", province="pomorskie", population=2165),
     ])
-    return towns
+    return tuple(towns)
+
+
+@cache
+def _get_polish_towns_by_name() -> dict[str, Town]:
+    return {t.name: t for t in scrape_polish_towns()}
 
 
 URL = "http://stadiumdb.com/stadiums/{}"
@@ -68,25 +89,33 @@ def scrape_basic_data(country=POLAND) -> list[BasicStadium]:
     basic_stadiums = []
     is_pl = country == POLAND
     url = URL_PL if is_pl else URL
-    towns = {t.name: t for t in scrape_polish_towns()} if is_pl else None
-    soup = getsoup(url.format(country.id))
+    towns = _get_polish_towns_by_name() if is_pl else None
+    country_name = country.name
+    soup = getsoup(url.format(country.id), parse_only=SoupStrainer(["h2", "table"]))
     leagues = [normalize(h2.text.strip()) for h2 in soup.find_all("h2")]
     has_national = leagues[0] in ("National Stadium", "Stadion Narodowy")
     for idx, table in enumerate(soup.find_all("table")):
-        for row in table.find_all("tr")[1:]:
-            name_tag, town_tag, clubs_tag, cap_tag = row.find_all("td")
+        rows = table.find_all("tr")[1:]
+        if not rows:  # tables with no data rows needn't have a league heading
+            continue
+        # one (immutable) league object shared by all the table's stadiums
+        if leagues[idx] in ("Other", "Inne"):
+            league = League(leagues[idx])
+        else:
+            league = League(leagues[idx], idx if has_national else idx + 1)
+        for row in rows:
+            # cells are direct children of a row, no need to descend into their contents
+            name_tag, town_tag, clubs_tag, cap_tag = row.find_all("td", recursive=False)
             name, url = normalize(name_tag.text.strip()), name_tag.find("a").attrs["href"]
             town = normalize(town_tag.text.strip())
             if is_pl:
                 found = towns.get(town)
                 town = found or town
-            clubs = [normalize(club.strip()) for club in clubs_tag.text.split(", ")
-                     if club.strip() != "-"]
-            league = League(leagues[idx], idx if has_national else idx + 1)
-            league = League(league.name) if league.name in ("Other", "Inne") else league
+            clubs = [normalize(club) for club in map(str.strip, clubs_tag.text.split(", "))
+                     if club != "-"]
             cap = extract_int(cap_tag.text)
             basic_stadiums.append(
-                BasicStadium(name, url, country.name, town, tuple(clubs), league, cap))
+                BasicStadium(name, url, country_name, town, tuple(clubs), league, cap))
 
     return basic_stadiums
 
@@ -95,22 +124,46 @@ def throttling_delay() -> float:
     return round(random.uniform(0.8, 1.5), 3)
 
 
+_NON_WORD_REGEX = re.compile(r"[\W_]+")
+_COMMA_SPLIT_REGEX = re.compile(r"\s*,\s*")  # splits and strips the tokens in one go
+
+
+def _canonicalize_header(header: str) -> str:
+    """Case-fold ``header`` and strip it of anything that isn't a letter or a digit.
+    """
+    return _NON_WORD_REGEX.sub("", header.casefold())
+
+
+def _map_headers(rows: dict[str, set[str]]) -> dict[str, str]:
+    """Invert ``rows`` so that each (canonicalized) header variant maps to its field's name.
+    """
+    return {
+        _canonicalize_header(header): field for field, headers in rows.items()
+        for header in headers
+    }
+
+
+# names of Stadium's own fields (dataclasses put the inherited BasicStadium's ones first)
+_DETAILS_FIELDS = tuple(f.name for f in fields(Stadium)[len(fields(BasicStadium)):])
 AGGREGATED_FIELDS: defaultdict[str, list[str]] = defaultdict(list)
+_aggregated_fields_lock = threading.Lock()
 T2 = TypeVar("T2")
 
 
 class DetailsScraper:
+    __slots__ = "_basic_data", "_soup"
+    # headers are matched case- and punctuation-insensitively (see _canonicalize_header())
     ROWS = {
         "address": {"Address", "Addres", "Adfress"},
         "other_names": {"Nicknames", "Former name", "Other name", "Other names"},
         "illumination": {"Floodlights"},
         "record_attendance": {
-            "Record attendance", "Record Attendance", "Recod attendance",
+            "Record attendance", "Recod attendance",
             "Record attendance (MLS)", "Record attendance (football)", "Record attendence",
             "Record attnedance", "Record audience", "Rekord frekwencji", "Rercord attendance",
             "Attendance record"
         },
-        "cost": {"Cost", "cost", "Koszt", "Kost", "Renovation Cost", "Renovation cost"},
+        "cost": {"Cost", "Koszt", "Kost", "Renovation cost"},
         "design": {"Design time", "Date of project", "Project date"},
         "construction": {
             "Construction", "Concstruction", "Construction time", "Costruction", "Czas budowy"
@@ -122,25 +175,31 @@ class DetailsScraper:
         },
         "renovations": {"Renovations", "Renovation", "Renovatons"},
         "designer": {
-            "Design", "Deisgn", "Architect", "Designer", "Designs", "Project", "Projekt", "project"
-        },
-        "structural_engineer": {
-            "Structural Engineer", "Structural engineer", "Engineer", "Roof structure"
+            "Design", "Deisgn", "Architect", "Designer", "Designs", "Project", "Projekt"
         },
+        "structural_engineer": {"Structural engineer", "Engineer", "Roof structure"},
         "contractor": {"Contractor", "Contracor", "Constractor"},
-        "investor": {"Client", "Investors", "Operator", "Owner", "Ownership", "ownership"},
+        "investor": {"Client", "Investors", "Operator", "Owner", "Ownership"},
         "note": {
             "Hints", "Note", "Notes", "Notice", "Notices", "Other", "Others", "Within the project",
             "Dentro del proyecto"
         },
         "track_length": {},
     }
+    FIELDS = _map_headers(ROWS)
+    PARSED_TAGS = SoupStrainer(["table", "article"])  # only those are scraped from details pages
     DURATION_SEPARATORS = "-", "/"  # those are different glyphs
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = _map_headers(cls.ROWS)
+        # re-bind the handlers so that those overridden in a subclass get dispatched to
+        cls.HANDLERS = {
+            field: getattr(cls, handler.__name__) for field, handler in cls.HANDLERS.items()}
+
     def __init__(self, basic_data: BasicStadium) -> None:
         self._basic_data = basic_data
         self._soup: BeautifulSoup | None = None
-        self._text: str | None = None
 
     @staticmethod
     def _trim_multiples(text: str) -> str:
@@ -159,12 +218,12 @@ class DetailsScraper:
             text_func: Callable[[str], T] | None = None,
             details_func: Callable[[str], T2] | None = None
     ) -> tuple[T | str, T2 | str | None] | None:
-        details = None
-        if "(" in text:
+        if "(" not in text:  # the usual case of no details
             try:
-                text, details = cls._split_parenthesized(text)
-            except ValueError:
-                text, _, _ = text.partition("(")
+                return (text_func(text) if text_func else text), None
+            except ParsingError:
+                return None
+        text, details = cls._split_parenthesized(text)
         try:
             text = text_func(text) if text_func else text
             details = details_func(details) if details_func and details else details
@@ -173,16 +232,20 @@ class DetailsScraper:
             return None
 
     @classmethod
+    @lru_cache(maxsize=4096)  # the same years and spans recur across stadiums
     def _parse_duration(cls, text: str) -> date | Duration | None:
-        sep = from_iterable(cls.DURATION_SEPARATORS, lambda s: s in text)
+        # fast path for the most common case of a span of years, e.g. '1999-2001'
+        if (len(text) == 9 and text[4] in cls.DURATION_SEPARATORS and text[:4].isdecimal()
+                and text[5:].isdecimal()):
+            return Duration(date(int(text[:4]), 1, 1), date(int(text[5:]), 1, 1))
+        sep = next((s for s in cls.DURATION_SEPARATORS if s in text), None)
         if not sep or (sep == "/" and len(text) in (7, 10)):
             try:
                 return extract_date(text)
             except ParsingError:
                 return None
-        try:
-            first, second = text.split(sep)
-        except ValueError:
+        first, _, second = text.partition(sep)
+        if sep in second:
             return None
         first, second = first.strip(), second.strip()
         if len(first) == 4 and len(second) in (2, 4):
@@ -198,25 +261,28 @@ class DetailsScraper:
         except ParsingError:
             return None
 
-    def _parse_renovations(self) -> tuple[datetime | Duration, ...] | None:
-        text = self._text.removesuffix(".")
+    @classmethod
+    def _parse_renovations(cls, text: str) -> tuple[datetime | Duration, ...] | None:
+        text = text.removesuffix(".")
         cleaned_text = clean_parenthesized(text)
         renovations = []
-        for token in cleaned_text.split(","):
-            token = token.strip()
-            duration = self._parse_duration(token)
+        for token in _COMMA_SPLIT_REGEX.split(cleaned_text.strip()):
+            duration = cls._parse_duration(token)
             if duration:
                 renovations.append(duration)
         return tuple(renovations) or None
 
-    def _parse_cost(self) -> Cost | None:
-        return _CostSubParser(self._text).parse()
+    @staticmethod
+    def _parse_cost(text: str) -> Cost | None:
+        return _CostSubParser(text).parse()
 
-    def _parse_other_names(self) -> tuple[str | Nickname, ...] | None:
+    @classmethod
+    def _parse_other_names(cls, text: str) -> tuple[str | Nickname, ...] | None:
         other_names = []
-        for token in self._text.split(","):
-            token = token.strip()
-            result = self._parse_text_with_details(token, details_func=self._parse_duration)
+        for token in _COMMA_SPLIT_REGEX.split(text.strip()):
+            if not token:
+                continue
+            result = cls._parse_text_with_details(token, details_func=cls._parse_duration)
             if result:
                 name, duration = result
                 if duration:
@@ -225,16 +291,18 @@ class DetailsScraper:
                     other_names.append(name)
         return tuple(other_names) or None
 
-    def _parse_illumination(self) -> int | None:
-        if self._text == "none":
+    @staticmethod
+    def _parse_illumination(text: str) -> int | None:
+        if text == "none":
             return 0
         try:
-            return extract_int(self._text)
+            return extract_int(text)
         except ParsingError:
             return None
 
-    def _parse_record_attendance(self) -> tuple[int, str | None] | None:
-        record_attendance = self._parse_text_with_details(self._text, text_func=extract_int)
+    @classmethod
+    def _parse_record_attendance(cls, text: str) -> tuple[int, str | None] | None:
+        record_attendance = cls._parse_text_with_details(text, text_func=extract_int)
         if not record_attendance:
             return None
         record_attendance, record_attendance_details = record_attendance
@@ -242,8 +310,9 @@ class DetailsScraper:
             ".") if record_attendance_details else None
         return record_attendance, record_attendance_details
 
-    def _parse_inauguration(self) -> tuple[date, str | None] | None:
-        text = self._text.strip()
+    @classmethod
+    def _parse_inauguration(cls, text: str) -> tuple[date, str | None] | None:
+        text = text.strip()
         if ")" in text:  # trim multiples #1
             text, _, _ = text.partition(")")
             text += ")"
@@ -261,9 +330,9 @@ class DetailsScraper:
             # usual case of "text1 (text2)"
             date_is_first = text[0].isdigit()
             if date_is_first:
-                inauguration = self._parse_text_with_details(text, text_func=extract_date)
+                inauguration = cls._parse_text_with_details(text, text_func=extract_date)
             else:
-                inauguration = self._parse_text_with_details(text, details_func=extract_date)
+                inauguration = cls._parse_text_with_details(text, details_func=extract_date)
             if not inauguration:
                 return None
             if date_is_first:
@@ -283,45 +352,47 @@ class DetailsScraper:
             except ValueError:
                 return None
 
-    def _parse_designer(self) -> tuple[str, date | Duration | None] | None:
+    @classmethod
+    def _parse_designer(cls, text: str) -> tuple[str, date | Duration | None] | None:
         design = None
-        if ", " in self._text or " / " in self._text:
-            designer = clean_parenthesized(self._text)
+        if ", " in text or " / " in text:
+            designer = clean_parenthesized(text)
         else:
-            designer = self._parse_text_with_details(self._text, details_func=self._parse_duration)
+            designer = cls._parse_text_with_details(text, details_func=cls._parse_duration)
             if not designer:
                 return None
             designer, design = designer
         designer = designer.removesuffix(".")
         return designer, design
 
-    def _parse_note(self, old_note: str | None) -> str | None:
-        if old_note and self._text:
-            old_note += ", " + self._text[0].lower() + self._text[1:]
+    @staticmethod
+    def _parse_note(text: str, old_note: str | None) -> str | None:
+        if old_note and text:
+            old_note += ", " + text[0].lower() + text[1:]
         else:
-            old_note = self._text
+            old_note = text
         return old_note.removesuffix(".") if old_note else None
 
     @staticmethod
     def _parse_sub_capacity_amount(text: str) -> int:
         try:
             if "+" in text:
-                return sum(extract_int(token.strip()) for token in text.split("+") if token.strip())
+                return sum(extract_int(token) for token in map(str.strip, text.split("+")) if token)
             return extract_int(text)
         except ValueError:
             raise ParsingError
 
-    def _parse_sub_capacity(self, row: Tag) -> SubCapacity | None:
+    @classmethod
+    def _parse_sub_capacity(cls, text: str, row: Tag) -> SubCapacity | None:
         span = row.find("span")
         designation = span.text.strip() if span is not None else None
         designation = designation[1:-1] if designation else designation
-        if self._text.count("(") == 2:
-            first, second, _ = self._text.split("(")
+        if text.count("(") == 2:
+            first, _, rest = text.partition("(")
+            second, _, _ = rest.partition("(")
             text = first.strip() + f" ({second.strip()}"
-        else:
-            text = self._text
-        sub_capacity = self._parse_text_with_details(
-            text, text_func=self._parse_sub_capacity_amount)
+        sub_capacity = cls._parse_text_with_details(
+            text, text_func=cls._parse_sub_capacity_amount)
         if sub_capacity:
             sub_capacity, note = sub_capacity
             note = note if note not in designation else None
@@ -332,135 +403,155 @@ class DetailsScraper:
         article = self._soup.find("article", class_="stadium-description")
         if article is None:
             return None
-        lines = []
-        h2 = article.find("h2")
-        if h2 is not None:
-            lines.append(h2.text)
-        lines += [p.text for p in article.find_all("p")]
+        # a single walk over the article collecting its (first) headline and paragraphs
+        headline, paragraphs = None, []
+        for tag in article.find_all(["h2", "p"]):
+            if tag.name == "p":
+                paragraphs.append(tag.text)
+            elif headline is None:
+                headline = tag.text
+        lines = [headline, *paragraphs] if headline is not None else paragraphs
         return normalize("\n".join(lines)) if lines else None
 
-    @throttled(throttling_delay)
+    def _warn(self, field: str) -> None:
+        _log.warning(f"Unable to parse {field} from: {self._basic_data.url!r}")
+
+    def _handle_address(self, text: str, details: dict[str, Any]) -> None:
+        details["address"] = text.removesuffix(".")
+
+    def _handle_other_names(self, text: str, details: dict[str, Any]) -> None:
+        details["other_names"] = self._parse_other_names(text)
+        if not details["other_names"]:
+            self._warn("other names")
+
+    def _handle_illumination(self, text: str, details: dict[str, Any]) -> None:
+        details["floodlights_lux"] = self._parse_illumination(text)
+        if details["floodlights_lux"] is None:
+            self._warn("illumination")
+
+    def _handle_record_attendance(self, text: str, details: dict[str, Any]) -> None:
+        record_attendance = self._parse_record_attendance(text)
+        if not record_attendance:
+            details["record_attendance"] = record_attendance
+            self._warn("record attendance")
+        else:
+            details["record_attendance"], details["record_attendance_details"] = record_attendance
+
+    def _handle_cost(self, text: str, details: dict[str, Any]) -> None:
+        if not details["cost"]:  # ignore duplicated fields
+            details["cost"] = self._parse_cost(text)
+            if not details["cost"]:
+                self._warn("cost")
+
+    def _handle_design(self, text: str, details: dict[str, Any]) -> None:
+        details["design"] = self._parse_duration(self._trim_multiples(text))
+        if not details["design"]:
+            self._warn("design")
+
+    def _handle_construction(self, text: str, details: dict[str, Any]) -> None:
+        if not details["construction"]:  # ignore duplicated fields
+            try:
+                details["construction"] = self._parse_duration(self._trim_multiples(text))
+            except ValueError:
+                details["construction"] = None
+            if not details["construction"]:
+                self._warn("construction")
+
+    def _handle_inauguration(self, text: str, details: dict[str, Any]) -> None:
+        if not details["inauguration"]:  # ignore duplicated fields
+            inauguration = self._parse_inauguration(text)
+            if not inauguration:
+                details["inauguration"] = inauguration
+                self._warn("inauguration")
+            else:
+                details["inauguration"], details["inauguration_details"] = inauguration
+
+    def _handle_renovations(self, text: str, details: dict[str, Any]) -> None:
+        details["renovations"] = self._parse_renovations(text)
+        if not details["renovations"]:
+            self._warn("renovations")
+
+    def _handle_designer(self, text: str, details: dict[str, Any]) -> None:
+        designer = self._parse_designer(text)
+        if not designer:
+            details["designer"] = designer
+            self._warn("designer")
+        else:
+            details["designer"], new_design = designer
+            if new_design and not details["design"]:
+                details["design"] = new_design
+
+    def _handle_structural_engineer(self, text: str, details: dict[str, Any]) -> None:
+        details["structural_engineer"] = text.removesuffix(".")
+
+    def _handle_contractor(self, text: str, details: dict[str, Any]) -> None:
+        details["contractor"] = clean_parenthesized(text).removesuffix(".")
+
+    def _handle_investor(self, text: str, details: dict[str, Any]) -> None:
+        details["investor"] = text.removesuffix(".")
+
+    def _handle_note(self, text: str, details: dict[str, Any]) -> None:
+        details["note"] = self._parse_note(text, details["note"])
+
+    def _handle_track_length(self, text: str, details: dict[str, Any]) -> None:
+        details["track_length_metres"] = extract_int(text)
+
+    # maps ROWS' fields to handlers that parse the row's text into the stadium's details
+    HANDLERS = {
+        "address": _handle_address,
+        "other_names": _handle_other_names,
+        "illumination": _handle_illumination,
+        "record_attendance": _handle_record_attendance,
+        "cost": _handle_cost,
+        "design": _handle_design,
+        "construction": _handle_construction,
+        "inauguration": _handle_inauguration,
+        "renovations": _handle_renovations,
+        "designer": _handle_designer,
+        "structural_engineer": _handle_structural_engineer,
+        "contractor": _handle_contractor,
+        "investor": _handle_investor,
+        "note": _handle_note,
+        "track_length": _handle_track_length,
+    }
+
+    @throttled(
+        throttling_delay, key=lambda self: urlsplit(self._basic_data.url).netloc,
+        skip=lambda self: is_cached(self._basic_data.url))
     def scrape(self) -> Stadium:
-        self._soup = getsoup(self._basic_data.url)
+        self._soup = getsoup(self._basic_data.url, parse_only=self.PARSED_TAGS)
         table = self._soup.find("table", class_="stadium-info")
         if table is None:
             raise ScrapingError(
                 f"Page at {self._basic_data.url} contains no 'table' tag of class 'stadium-info'")
 
-        # fields initialization
-        # main
         sub_capacities = []
-        address, other_names, illumination, cost = None, None, None, None
-        record_attendance, record_attendance_details = None, None
-        # temporal
-        design, construction = None, None
-        inauguration, inauguration_details, renovations = None, None, None
-        # personal/corporate
-        designer, structural_engineer, contractor, investor = None, None, None, None
-        # other
-        note, track_length = None, None
-
+        details = dict.fromkeys(_DETAILS_FIELDS)
         for row in table.find_all("tr"):
             header = row.find("th").text.strip()
-            self._text = normalize(row.find("td").text.strip())
-            if header in self.ROWS["address"]:
-                address = self._text.removesuffix(".")
-            elif header in self.ROWS["other_names"]:
-                other_names = self._parse_other_names()
-                if not other_names:
-                    _log.warning(f"Unable to parse other names from: {self._basic_data.url!r}")
-            elif header in self.ROWS["illumination"]:
-                illumination = self._parse_illumination()
-                if illumination is None:
-                    _log.warning(f"Unable to parse illumination from: {self._basic_data.url!r}")
-            elif header in self.ROWS["record_attendance"]:
-                record_attendance = self._parse_record_attendance()
-                if not record_attendance:
-                    _log.warning(
-                        f"Unable to parse record attendance from: {self._basic_data.url!r}")
-                else:
-                    record_attendance, record_attendance_details = record_attendance
-            elif header in self.ROWS["cost"]:
-                if not cost:  # ignore duplicated fields
-                    cost = self._parse_cost()
-                    if not cost:
-                        _log.warning(f"Unable to parse cost from: {self._basic_data.url!r}")
-            elif header in self.ROWS["design"]:
-                design = self._parse_duration(self._trim_multiples(self._text))
-                if not design:
-                    _log.warning(f"Unable to parse design from: {self._basic_data.url!r}")
-            elif header in self.ROWS["construction"]:
-                if not construction:  # ignore duplicated fields
-                    try:
-                        construction = self._parse_duration(self._trim_multiples(self._text))
-                    except ValueError:
-                        construction = None
-                    if not construction:
-                        _log.warning(f"Unable to parse construction from: {self._basic_data.url!r}")
-            elif header in self.ROWS["inauguration"]:
-                if not inauguration:  # ignore duplicated fields
-                    inauguration = self._parse_inauguration()
-                    if not inauguration:
-                        _log.warning(f"Unable to parse inauguration from: {self._basic_data.url!r}")
-                    else:
-                        inauguration, inauguration_details = inauguration
-            elif header in self.ROWS["renovations"]:
-                renovations = self._parse_renovations()
-                if not renovations:
-                    _log.warning(f"Unable to parse renovations from: {self._basic_data.url!r}")
-            elif header in self.ROWS["designer"]:
-                designer = self._parse_designer()
-                if not designer:
-                    _log.warning(f"Unable to parse designer from: {self._basic_data.url!r}")
-                else:
-                    designer, new_design = designer
-                    design = new_design if new_design and not design else design
-            elif header in self.ROWS["structural_engineer"]:
-                structural_engineer = self._text.removesuffix(".")
-            elif header in self.ROWS["contractor"]:
-                contractor = clean_parenthesized(self._text).removesuffix(".")
-            elif header in self.ROWS["investor"]:
-                investor = self._text.removesuffix(".")
-            elif header in self.ROWS["note"]:
-                note = self._parse_note(note)
-            elif header in self.ROWS["track_length"]:
-                track_length = extract_int(self._text)
+            text = normalize(row.find("td").text.strip())
+            field = self.FIELDS.get(_canonicalize_header(header))
+            if field:
+                self.HANDLERS[field](self, text, details)
             elif not header:
-                sub_capacity = self._parse_sub_capacity(row)
+                sub_capacity = self._parse_sub_capacity(text, row)
                 if sub_capacity:
                     sub_capacities.append(sub_capacity)
-                elif self._text:
+                elif text:
                     _log.warning(
-                        f"Unable to parse sub-capacity from text: {self._text!r} in"
+                        f"Unable to parse sub-capacity from text: {text!r} in"
                         f" {self._basic_data.url!r}")
             else:
-                AGGREGATED_FIELDS[header].append(self._basic_data.url)
-
-        return Stadium(
-            **asdict(self._basic_data),
-            capacity_details=tuple(sub_capacities) or None,
-            address=address,
-            other_names=other_names,
-            floodlights_lux=illumination,
-            record_attendance=record_attendance,
-            record_attendance_details=record_attendance_details,
-            cost=cost,
-            design=design,
-            construction=construction,
-            inauguration=inauguration,
-            inauguration_details=inauguration_details,
-            renovations=renovations,
-            designer=designer,
-            structural_engineer=structural_engineer,
-            contractor=contractor,
-            investor=investor,
-            note=note,
-            track_length_metres=track_length,
-            description=self._parse_description()
-        )
+                with _aggregated_fields_lock:
+                    AGGREGATED_FIELDS[header].append(self._basic_data.url)
+
+        details["capacity_details"] = tuple(sub_capacities) or None
+        details["description"] = self._parse_description()
+        return Stadium.from_basic(self._basic_data, **details)
 
 
 class DetailsScraperPl(DetailsScraper):
+    __slots__ = ()
     ROWS = {
         "address": {"Adres"},
         "other_names": {"Inne nazwy", "Nazwy potoczne"},
@@ -485,52 +576,53 @@ class DetailsScraperPl(DetailsScraper):
         super().__init__(basic_data)
 
 
+_DIGIT_REGEX = re.compile(r"\d")
+
+
 class _CostSubParser:
     MILLION_QUALIFIERS = "million", "mln", "M", "m", "milion", "Million", "millones"
     BILLION_QUALIFIERS = "billion", "bln", "B", "b", "N", "miliard", "mld"
     TRILLION_QUALIFIERS = "trillion",
+    MULTIPLIERS = {
+        **dict.fromkeys(MILLION_QUALIFIERS, 1_000_000),
+        **dict.fromkeys(BILLION_QUALIFIERS, 1_000_000_000),
+        **dict.fromkeys(TRILLION_QUALIFIERS, 1_000_000_000_000),
+    }
+    QUALIFIERS = tuple(MULTIPLIERS)
     APPROXIMATORS = "approx. ", "app. ", "ok. "
     COMPOUND_SEPARATORS = " + ", ", "
 
     def __init__(self, text: str) -> None:
         self._text = self._prepare_text(text)
-        self._tokens = [t.strip() for t in self._text.split()]
+        self._tokens = self._text.split()  # no-argument split() already strips the tokens
 
     @classmethod
     def _prepare_text(cls, text: str) -> str:
         text, _, _ = text.partition("(")
         text, _, _ = text.strip().partition(" / ")
         text = text.strip()
-        approx = from_iterable(cls.APPROXIMATORS, lambda a: text.startswith(a))
-        if approx:
+        if text.startswith(cls.APPROXIMATORS):
+            approx = from_iterable(cls.APPROXIMATORS, lambda a: text.startswith(a))
             text = text.removeprefix(approx)
         return text
 
     @classmethod
     def _identify_qualifier(cls, *tokens: str, strict=False) -> tuple[int, str]:
-        qualifiers = (*cls.MILLION_QUALIFIERS, *cls.BILLION_QUALIFIERS, *cls.TRILLION_QUALIFIERS)
         for i, token in enumerate(tokens):
-            for qualifier in qualifiers:
-                if strict:
-                    if token == qualifier:
-                        return i, qualifier
-                else:
-                    if token.endswith(qualifier):
-                        return i, qualifier
+            if strict:
+                if token in cls.MULTIPLIERS:
+                    return i, token
+            elif token.endswith(cls.QUALIFIERS):
+                return i, from_iterable(cls.QUALIFIERS, lambda q: token.endswith(q))
         return -1, ""
 
     @classmethod
     def _get_qualified_amount(cls, amount: str, qualifier: str) -> int:
-        base_amount = extract_float(amount)
-        if qualifier in cls.MILLION_QUALIFIERS:
-            return int(base_amount * 1_000_000)
-        if qualifier in cls.BILLION_QUALIFIERS:
-            return int(base_amount * 1_000_000_000)
-        return int(base_amount * 1_000_000_000_000)
+        return int(extract_float(amount) * cls.MULTIPLIERS[qualifier])
 
     @staticmethod
     def _split_merged(text: str) -> tuple:
-        match = re.search(r"\d", text)
+        match = _DIGIT_REGEX.search(text)
         if not match:
             return ()
         return text[:match.start()], text[match.start():]
@@ -642,20 +734,34 @@ class _CostSubParser:
         return None
 
 
-def scrape_stadiums(country=POLAND) -> Iterator[Stadium]:
+def scrape_stadiums(country=POLAND, workers=SCRAPING_WORKERS) -> Iterator[Stadium]:
+    """Scrape stadiums of ``country``, running up to ``workers`` detail scrapers concurrently.
+
+    Stadiums are yielded in the order of the country's listing.
+    """
     scraper = DetailsScraperPl if country == POLAND else DetailsScraper
     basic_stadiums = scrape_basic_data(country)
     _log.info(f"Only {len(basic_stadiums)} stadium(s) to go...")
-    for stadium in basic_stadiums:
+
+    def scrape(stadium: BasicStadium) -> Stadium | None:
         try:
-            yield scraper(stadium).scrape()
-        except ScrapingError as e:
+            return scraper(stadium).scrape()
+        except (ScrapingError, HTTPError) as e:  # HTTPError once retries are exhausted
             _log.error(f"Scraping of {stadium.name} failed with: {e}")
+            return None
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for result in executor.map(scrape, basic_stadiums):
+            if result is not None:
+                yield result
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 def scrape_countries() -> Iterator[Country]:
     url = "http://stadiumdb.com/stadiums"
-    soup = getsoup(url)
+    soup = getsoup(url, parse_only=SoupStrainer(["h2", "ul"]))
     confederations = [h2.text.strip() for h2 in soup.find_all("h2")]
     uls = soup.find_all("ul", class_="country-list")
     for idx, ul in enumerate(uls):
@@ -670,9 +776,10 @@ def scrape_countries() -> Iterator[Country]:
 
 @http_requests_counted("country scraping")
 @timed("country scraping", precision=2)
-def scrape_country_stadiums(country: Country) -> CountryStadiumsData | None:
+def scrape_country_stadiums(
+        country: Country, workers=SCRAPING_WORKERS) -> CountryStadiumsData | None:
     _log.info(f"Scraping {country.name!r} started...")
-    stadiums = [*scrape_stadiums(country)]
+    stadiums = [*scrape_stadiums(country, workers)]
     url = URL.format(country.id)
     if not stadiums:
         _log.warning(f"Nothing has been scraped for {url!r}")
@@ -684,29 +791,44 @@ def dump_aggregated_fields() -> None:
     if AGGREGATED_FIELDS:
         timestamp = datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
         dest = OUTPUT_DIR / f"aggregated_fields_{timestamp}.json"
-        with dest.open("w", encoding="utf8") as f:
-            json.dump(AGGREGATED_FIELDS, f, indent=4, ensure_ascii=False)
+        dest.write_bytes(orjson.dumps(AGGREGATED_FIELDS, option=orjson.OPT_INDENT_2))
         if dest.exists():
             _log.info(f"Successfully dumped '{dest}'")
 
 
-def _parse_countries(*c_specs: str, excluded: Iterable[str] = ()) -> list[Country]:
-    scraped_countries = scrape_countries()
-    if not c_specs and not excluded:
-        return sorted(scraped_countries, key=attrgetter("id"))
+@cache
+def _get_scraped_countries() -> tuple[Country, ...]:
+    """Return all countries scraped from stadiumdb.com sorted by ID.
+
+    The result is cached so the page is requested at most once per process.
+    """
+    return tuple(sorted(scrape_countries(), key=attrgetter("id")))
+
 
-    # maps
+@cache
+def _get_country_maps() -> tuple[
+        dict[str, Country], dict[str, Country], dict[str, list[Country]]]:
+    """Return scraped countries mapped by ID, by name and by confederation.
+    """
     countries_by_id, countries_by_name = {}, {}
     countries_by_conf = defaultdict(list)
-    for country in scraped_countries:
+    for country in _get_scraped_countries():
         countries_by_id[country.id] = country
         countries_by_name[country.name] = country
         countries_by_conf[country.confederation].append(country)
+    return countries_by_id, countries_by_name, dict(countries_by_conf)
+
+
+def _parse_countries(*c_specs: str, excluded: Iterable[str] = ()) -> list[Country]:
+    if not c_specs and not excluded:
+        return [*_get_scraped_countries()]
+
+    c_maps = _get_country_maps()
 
     def _get_countries(*specifiers: str) -> set[Country]:
         result = set()
         for spec in specifiers:
-            for c_map in (countries_by_id, countries_by_name, countries_by_conf):
+            for c_map in c_maps:
                 country = c_map.get(spec)
                 if country:
                     if isinstance(country, list):
@@ -722,14 +844,14 @@ def _parse_countries(*c_specs: str, excluded: Iterable[str] = ()) -> list[Countr
 
         return result
 
-    countries = _get_countries(*c_specs)
+    countries = _get_countries(*c_specs) if c_specs else _get_scraped_countries()
 
     if not excluded:
         return sorted(countries, key=attrgetter("id"))
 
-    excluded_countries = _get_countries(*excluded)
+    excluded_ids = frozenset(c.id for c in _get_countries(*excluded))
 
-    return sorted([c for c in countries if c not in excluded_countries], key=attrgetter("id"))
+    return sorted([c for c in countries if c.id not in excluded_ids], key=attrgetter("id"))
 
 
 @http_requests_counted("dump")
@@ -743,27 +865,15 @@ def dump_stadiums(*countries: str, **kwargs: Any) -> None:
         prefix: a prefix for a dumpfile's name
         filename: a complete filename for the dumpfile (renders moot other filename-concerned arguments)
         output_dir: an output directory (if not provided, defaults to OUTPUT_DIR)
+        workers: number of stadiums scraped concurrently (defaults to SCRAPING_WORKERS)
 
     Args:
         countries: variable number of country specifiers (name, ID or confederation)
         kwargs: optional arguments
     """
     now = datetime.now()
-    excluded = kwargs.get("excluded")
-    excluded = set(excluded) if excluded else set()
-    countries = _parse_countries(*countries, excluded=excluded)
-    _log.info(f"Scraping {len(countries)} country(ies) started...")
-    data = {
-        "timestamp": now.strftime(READABLE_TIMESTAMP_FORMAT),
-        "countries": []
-    }
-    for country in countries:
-        try:
-            country_stadiums_data = scrape_country_stadiums(country)
-            if country_stadiums_data:
-                data["countries"].append(country_stadiums_data.json)
-        except Exception as e:
-            _log.error(f"{type(e).__qualname__}: {e}:\n{traceback.format_exc()}")
+    countries = _parse_countries(*countries, excluded=kwargs.get("excluded") or ())
+    workers = kwargs.get("workers") or SCRAPING_WORKERS
 
     try:
         prefix = kwargs.get("prefix") or "stadiums"
@@ -780,12 +890,32 @@ def dump_stadiums(*countries: str, **kwargs: Any) -> None:
             filename = f"{prefix}dump{timestamp}.json"
 
         dest = output_dir / filename
-        with dest.open("w", encoding="utf8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # countries are written as soon as they're scraped (so only one is held in memory at a
+        # time), laid out as 'orjson.dumps(data, option=orjson.OPT_INDENT_2)' would do it for
+        # the whole dump
+        with dest.open("wb") as f:
+            f.write(b'{\n  "timestamp": %b,\n  "countries": [' % orjson.dumps(
+                now.strftime(READABLE_TIMESTAMP_FORMAT)))
+            dumped = 0
+            try:
+                _log.info(f"Scraping {len(countries)} country(ies) started...")
+                for country in countries:
+                    try:
+                        country_stadiums_data = scrape_country_stadiums(country, workers)
+                        if country_stadiums_data:
+                            data = orjson.dumps(
+                                country_stadiums_data.json, option=orjson.OPT_INDENT_2)
+                            f.write(b",\n    " if dumped else b"\n    ")
+                            f.write(data.replace(b"\n", b"\n    "))
+                            dumped += 1
+                    except Exception as e:
+                        _log.error(f"{type(e).__qualname__}: {e}", exc_info=True)
+            finally:
+                f.write(b"\n  ]\n}" if dumped else b"]\n}")
         if dest.exists():
             _log.info(f"Successfully dumped '{dest}'")
     except Exception as e:
-        _log.critical(f"{type(e).__qualname__}: {e}:\n{traceback.format_exc()}")
+        _log.critical(f"{type(e).__qualname__}: {e}", exc_info=True)
 
 
 def load_stadiums(file: PathLike) -> list[CountryStadiumsData]:
@@ -799,27 +929,37 @@ def load_stadiums(file: PathLike) -> list[CountryStadiumsData]:
     Returns:
         list of CountryStadiumData objects
     """
-    file = Path(file)
-    with file.open() as f:
-        raw_data = json.load(f)
+    raw_data = orjson.loads(Path(file).read_bytes())
     return [CountryStadiumsData.from_json(c) for c in raw_data["countries"]]
 
 
-def stadiums_per_town(stadiums: Iterable[Stadium], towns: Iterable[Town]) -> list:
+def stadiums_per_town(
+        stadiums: Iterable[Stadium], towns: Iterable[Town], serialize=True) -> list:
+    """Aggregate modern stadiums per town they're located in.
+
+    Args:
+        stadiums: stadiums to aggregate
+        towns: towns to look the population up in
+        serialize: whether to output stadiums as dicts (default) or leave them as they are
+
+    Returns:
+        list of per-town dicts sorted by total capacity (descending)
+    """
     towns = {t.name: t for t in towns}
-    modern_stadiums = [s for s in stadiums if s.is_modern]
-    aggregated = defaultdict(list)
-    for stadium in modern_stadiums:
-        aggregated[stadium.town].append(stadium)
+    aggregated, capacities = defaultdict(list), defaultdict(int)
+    for stadium in stadiums:
+        if stadium.is_modern:
+            aggregated[stadium.town].append(stadium)
+            capacities[stadium.town] += stadium.capacity
 
     result = []
     for town, stadiums in aggregated.items():
         pop = towns[town].population
-        cap = sum(s.capacity for s in stadiums)
+        cap = capacities[town]
         result.append(
             {
                 "town": town,
-                "stadiums": [asdict(s) for s in stadiums],
+                "stadiums": [asdict(s) for s in stadiums] if serialize else stadiums,
                 "population": pop,
                 "total_capacity": cap,
                 "cap2pop": f"{cap / pop * 100:.2f} %",
@@ -10,7 +10,8 @@
 import click
 
 from pilka.stadiums import dump_stadiums
-from pilka.constants import OUTPUT_DIR
+from pilka.constants import HTTP_CACHE_DIR, OUTPUT_DIR, SCRAPING_WORKERS
+from pilka.utils.scrape import set_http_cache
 
 
 @click.group()
@@ -33,10 +34,19 @@ def stadiums() -> None:
 @click.option(
     "--excluded", "-e", multiple=True,
     help="multiple specifier for countries to be excluded from dump (name, ID, or confederation)")
+@click.option(
+    "--workers", "-w", type=click.IntRange(min=1), default=SCRAPING_WORKERS, show_default=True,
+    help="number of stadiums scraped concurrently (requests stay throttled regardless)")
+@click.option(
+    "--http-cache/--no-http-cache", default=False, show_default=True,
+    help=f"reuse recently requested pages (cached at: '{HTTP_CACHE_DIR}') or not")
 @click.argument("countries", nargs=-1)
-def dump(countries, excluded, filename, output_dir, timestamp, prefix) -> None:
+def dump(
+        countries, excluded, filename, output_dir, timestamp, prefix, workers,
+        http_cache) -> None:
     """Dump stadiums data for COUNTRIES (all if not specified).
     """
+    set_http_cache(HTTP_CACHE_DIR if http_cache else None)
     dump_stadiums(
         *countries, excluded=excluded, filename=filename, output_dir=output_dir,
-        use_timestamp=timestamp, prefix=prefix)
+        use_timestamp=timestamp, prefix=prefix, workers=workers)
@@ -7,8 +7,9 @@
     @author: z33k
 
 """
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields
 from datetime import date, timedelta
+from functools import cache
 from typing import Any, Type
 
 from currency_converter import CurrencyConverter
@@ -17,7 +18,13 @@ from pilka.constants import Json, T
 from pilka.utils import get_classes_in_module, get_properties, tolist, totuple
 
 
-currency_converter = CurrencyConverter()
+@cache
+def get_currency_converter() -> CurrencyConverter:
+    """Return a shared currency converter, loading its rates data on first use only.
+    """
+    return CurrencyConverter()
+
+
 CURRENCIES = {  # symbols seen in the data mapped to iso monikers
     'A$': 'AUD',
     'AU$': 'AUD',
@@ -47,11 +54,12 @@ CURRENCIES = {  # symbols seen in the data mapped to iso monikers
 
 
 def _serialize(data: Json) -> Json:  # recursive
+    if isinstance(data, _JsonSerializable):
+        return data.json
     if isinstance(data, tuple):
         data = tolist(data)
     if isinstance(data, list):
-        for idx, item in enumerate(data):
-            data[idx] = _serialize(item)
+        data = [_serialize(item) for item in data]
     elif isinstance(data, dict):
         data = {k: v for k, v in data.items() if v is not None}
         for k, v in data.items():
@@ -120,12 +128,12 @@ def _process_dates(data: Json) -> Json:
     return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _JsonSerializable:
     @property
     def json(self) -> Json:
-        data = {k: v for k, v in asdict(self).items() if v is not None}
-        return _serialize(data)
+        # nested structures serialize themselves (without 'asdict()' deep-copying them first)
+        return _serialize({f.name: getattr(self, f.name) for f in fields(self)})
 
     @classmethod
     def from_json(cls, data: Json) -> "_JsonSerializable":
@@ -142,7 +150,7 @@ class _JsonSerializable:
         return cls(**data)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Town(_JsonSerializable):
     name: str
     county: str
@@ -206,13 +214,13 @@ def get_tier(capacity: int) -> str:
     return "XII"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class League(_JsonSerializable):
     name: str
     tier: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BasicStadium(_JsonSerializable):
     name: str
     url: str
@@ -230,7 +238,7 @@ class BasicStadium(_JsonSerializable):
 _KORONA_INAUGURATION = date(2006, 4, 1)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cost(_JsonSerializable):
     amount: int
     currency: str
@@ -252,7 +260,7 @@ class Cost(_JsonSerializable):
         if len(currency) != 3:
             return None
         try:
-            return int(currency_converter.convert(self.amount, currency, currency_iso))
+            return int(get_currency_converter().convert(self.amount, currency, currency_iso))
         except ValueError:
             return None
 
@@ -269,7 +277,7 @@ class Cost(_JsonSerializable):
         return self._get_amount_in("PLN")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Duration(_JsonSerializable):
     start: date
     end: date
@@ -279,20 +287,20 @@ class Duration(_JsonSerializable):
         return self.end - self.start
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nickname(_JsonSerializable):
     name: str
     duration: Duration | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubCapacity(_JsonSerializable):
     capacity: int
     designation: str | None
     note: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stadium(BasicStadium):
     capacity_details: tuple[SubCapacity, ...] | None
     address: str | None
@@ -314,6 +322,12 @@ class Stadium(BasicStadium):
     track_length_metres: int | None
     description: str | None
 
+    @classmethod
+    def from_basic(cls, basic: BasicStadium, **details: Any) -> "Stadium":
+        """Build a stadium from ``basic`` data (shared as is, without copying) and ``details``.
+        """
+        return cls(**{f.name: getattr(basic, f.name) for f in fields(BasicStadium)}, **details)
+
     @property
     def is_modern(self) -> bool:
         last_renovation = self.renovations[-1] if self.renovations else None
@@ -325,7 +339,7 @@ class Stadium(BasicStadium):
         return result >= _KORONA_INAUGURATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Country(_JsonSerializable):
     name: str
     id: str
@@ -340,7 +354,7 @@ CZECHIA = Country(name="Czech Republic", id="cze", confederation="UEFA")
 GERMANY = Country(name="Germany", id="ger", confederation="UEFA")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CountryStadiumsData(_JsonSerializable):
     country: Country
     url: str
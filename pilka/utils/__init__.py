@@ -13,7 +13,7 @@ import os
 import re
 import sys
 from datetime import date, datetime
-from functools import wraps
+from functools import lru_cache, wraps
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Callable, Iterable, Optional, Protocol, Sequence, Set, Type
@@ -93,6 +93,7 @@ def extract_int(text: str) -> int:
     return int(num)
 
 
+@lru_cache(maxsize=2048)
 @type_checker(str)
 def extract_date(text: str, month_in_the_middle=True) -> date:
     """Extract a date object from text.
@@ -297,13 +298,15 @@ def cleardir(obj: object) -> list[str]:
     return [attr for attr in dir(obj) if not attr.startswith("_")]
 
 
+_SPACED_PARENTHESIZED_REGEX = re.compile(r"\s\(.*?\)")
+_PARENTHESIZED_REGEX = re.compile(r"\(.*?\)")
+
+
 def clean_parenthesized(text: str) -> str:
     """Get rid of anything in text within (single or multiple) parentheses.
     """
     if " (" in text:
-        pattern = r"\s\(.*?\)"
-        text = re.sub(pattern, "", text)
+        text = _SPACED_PARENTHESIZED_REGEX.sub("", text)
     if "(" in text:
-        pattern = r"\(.*?\)"
-        text = re.sub(pattern, "", text)
+        text = _PARENTHESIZED_REGEX.sub("", text)
     return text
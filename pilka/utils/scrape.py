@@ -7,17 +7,25 @@
     @author: z33k
 
 """
+import hashlib
 import logging
+import threading
 import time
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Dict
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Callable, Dict, Hashable
 
+import backoff
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from pilka.constants import REQUEST_TIMEOUT
-from pilka.utils import timed
+from pilka.constants import CONNECTION_POOL_SIZE, HTTP_CACHE_EXPIRY, PathLike, \
+    RATE_LIMIT_MAX_WAIT, REQUEST_TIMEOUT
+from pilka.utils import getdir, timed
 from pilka.utils.check_type import type_checker
 
 
@@ -30,53 +38,185 @@ class ScrapingError(IOError):
 
 
 http_requests_count = 0
+_http_requests_lock = threading.Lock()
+_session = requests.Session()  # reuses connections (keep-alive) across requests
+# the default pool keeps only 10 connections per host, discarding any extra ones opened by
+# concurrent scrapers
+_adapter = HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+RETRIED_STATUS_CODES = 429, 500, 502, 503, 504
+_host_holds: dict[str, float] = {}  # hosts mapped to monotonic times their requests may resume at
+_host_holds_lock = threading.Lock()
+_http_cache_dir: Path | None = None  # no caching by default
+
+
+def set_http_cache(cache_dir: PathLike | None) -> None:
+    """Cache successfully requested pages as files in ``cache_dir`` (or stop caching on ``None``).
+
+    Cached pages are reused by `getsoup()` (instead of being requested again) until they're older
+    than HTTP_CACHE_EXPIRY.
+
+    Args:
+        cache_dir: a directory to store cached pages in (created if missing) or None
+    """
+    global _http_cache_dir
+    _http_cache_dir = getdir(cache_dir) if cache_dir is not None else None
+
+
+def _get_cache_file(url: str, headers: Dict[str, str] | None = None) -> Path | None:
+    if _http_cache_dir is None:
+        return None
+    key = url + (repr(sorted(headers.items())) if headers else "")
+    return _http_cache_dir / f"{hashlib.sha256(key.encode('utf8')).hexdigest()}.html"
+
+
+def is_cached(url: str, headers: Dict[str, str] | None = None) -> bool:
+    """Return ``True`` if a fresh copy of the page at ``url`` is in the HTTP cache.
+    """
+    file = _get_cache_file(url, headers)
+    try:
+        return file is not None and time.time() - file.stat().st_mtime < HTTP_CACHE_EXPIRY
+    except FileNotFoundError:
+        return False
+
+
+def _get_rate_limit_wait(response: requests.Response) -> float | None:
+    """Return seconds the response's host asked to be left alone for (or ``None`` if it didn't).
+
+    Both 'Retry-After' (in seconds or as an HTTP date) on 429 and 503 responses and exhausted
+    'X-RateLimit-Remaining' with 'X-RateLimit-Reset' (in seconds or as an epoch timestamp) are
+    recognized. The wait is capped at RATE_LIMIT_MAX_WAIT.
+    """
+    headers = response.headers
+    retry_after = headers.get("Retry-After")
+    if retry_after and response.status_code in (429, 503):
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            wait = float(retry_after)
+        else:
+            try:
+                wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+    elif headers.get("X-RateLimit-Remaining", "").strip() == "0":
+        try:
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            return None
+        wait = reset - time.time() if reset > 1_000_000_000 else reset  # epoch or delta
+    else:
+        return None
+    return min(max(wait, 0.0), RATE_LIMIT_MAX_WAIT)
+
+
+def _hold_host(host: str, seconds: float) -> None:
+    """Hold back all requests to ``host`` (in all threads) for ``seconds``.
+    """
+    _log.warning(f"Rate-limited by {host!r}, holding its requests back for {seconds:.3f} seconds")
+    with _host_holds_lock:
+        _host_holds[host] = max(_host_holds.get(host, 0.0), time.monotonic() + seconds)
+
+
+def _wait_for_host(host: str) -> None:
+    with _host_holds_lock:
+        resume_at = _host_holds.get(host, 0.0)
+    wait = resume_at - time.monotonic()
+    if wait > 0:
+        throttle(wait)
 
 
 @timed("request")
+@backoff.on_exception(backoff.expo, HTTPError, max_tries=5)
 @type_checker(str)
-def getsoup(url: str, headers: Dict[str, str] | None = None) -> BeautifulSoup:
+def getsoup(
+        url: str, headers: Dict[str, str] | None = None,
+        parse_only: SoupStrainer | None = None) -> BeautifulSoup:
     """Return BeautifulSoup object based on ``url``.
 
+    Requests that fail with a transient status (rate-limiting or server errors) are retried
+    with exponential backoff. If the host asks for a pause (via 'Retry-After' or 'X-RateLimit-*'
+    headers), all requests to it are held back for that long. If HTTP caching is on (see
+    `set_http_cache()`), fresh cached pages are parsed instead of being requested.
+
     Args:
         url: URL string
         headers: a dictionary of headers to add to the request
+        parse_only: a strainer limiting the parsed tree to the matching tags (and their contents)
 
     Returns:
         a BeautifulSoup object
     """
+    cache_file = _get_cache_file(url, headers)
+    if cache_file is not None and is_cached(url, headers):
+        _log.info(f"Reading cached: {url!r}")
+        return BeautifulSoup(
+            cache_file.read_text(encoding="utf8"), "lxml", parse_only=parse_only)
+
+    host = urlsplit(url).netloc
+    _wait_for_host(host)
     _log.info(f"Requesting: {url!r}")
     global http_requests_count
-    response = requests.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
-    http_requests_count += 1
+    response = _session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+    with _http_requests_lock:
+        http_requests_count += 1
+    if (wait := _get_rate_limit_wait(response)) is not None:
+        _hold_host(host, wait)
     if str(response.status_code)[0] in ("4", "5"):
         msg = f"Request failed with: '{response.status_code} {response.reason}'"
-        if response.status_code in (502, 503, 504):
-            raise HTTPError(msg)
+        if response.status_code in RETRIED_STATUS_CODES:
+            raise HTTPError(msg, response=response)
         _log.warning(msg)
-    return BeautifulSoup(response.text, "lxml")
+    elif cache_file is not None:
+        # written aside and then moved into place, so concurrent readers never see a partial page
+        tmp = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(response.text, encoding="utf8")
+        tmp.replace(cache_file)
+    return BeautifulSoup(response.text, "lxml", parse_only=parse_only)
 
 
 def throttle(delay: float | Callable[..., float]) -> None:
     amount = delay() if callable(delay) else delay
-    _log.info(f"Throttling for {amount} seconds...")
+    _log.info(f"Throttling for {amount:.3f} seconds...")
     time.sleep(amount)
 
 
-def throttled(delay: float | Callable[..., float]) -> Callable:
-    """Add throttling delay after the decorated operation.
+def throttled(
+        delay: float | Callable[..., float],
+        key: Callable[..., Hashable] | None = None,
+        skip: Callable[..., bool] | None = None) -> Callable:
+    """Throttle the decorated operation so that its calls start at least ``delay`` seconds apart.
+
+    The throttling is shared by all threads calling the operation, so running it concurrently
+    overlaps the calls' work without increasing their rate. If ``key`` is provided, calls are
+    throttled separately for each key it returns (e.g. per requested host). If ``skip`` is
+    provided, calls for which it returns ``True`` (e.g. served from cache) aren't throttled.
 
     Args:
-        throttling delay in fraction of seconds
+        delay: throttling delay in fraction of seconds (or a callable returning it)
+        key: optional callable deriving a throttling key from the decorated function's arguments
+        skip: optional predicate on the decorated function's arguments
 
     Returns:
         the decorated function
     """
     def decorate(func: Callable) -> Callable:
+        lock = threading.Lock()
+        next_starts: dict[Hashable, float] = {}
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            result = func(*args, **kwargs)
-            throttle(delay)
-            return result
+            if skip and skip(*args, **kwargs):
+                return func(*args, **kwargs)
+            amount = delay() if callable(delay) else delay
+            k = key(*args, **kwargs) if key else None
+            with lock:
+                now = time.monotonic()
+                start = max(now, next_starts.get(k, 0.0))
+                next_starts[k] = start + amount
+            if start > now:
+                throttle(start - now)
+            return func(*args, **kwargs)
         return wrapper
     return decorate
 